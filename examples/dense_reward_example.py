@@ -8,12 +8,11 @@ import numpy as np
 import argparse
 import os
 
-from libero.libero import get_env_from_task
+from libero.libero import get_vec_env_from_task
 from libero.libero.benchmark import get_task
 
-def get_libero_dummy_action():
-    """Get dummy/no-op action, used to roll out the simulation while the robot does nothing."""
-    return [0, 0, 0, 0, 0, 0, -1]
+# Dummy/no-op action, used to roll out the simulation while the robot does nothing
+_DUMMY_ACTION = np.array([0, 0, 0, 0, 0, 0, -1], dtype=np.float32)
 
 def main(args):
     # Get the task information
@@ -21,35 +20,50 @@ def main(args):
     print(f"Task: {task.name}")
     print(f"Language instruction: {task.language}")
     
-    # Create the environment with dense rewards enabled
-    env = get_env_from_task(
+    # Create the environments with dense rewards enabled, stepped in parallel worker processes
+    env = get_vec_env_from_task(
         task=task.name,
+        n_envs=args.n_envs,
         task_id=args.task_id,
         benchmark=args.benchmark,
+        seed=args.seed,
         control_freq=args.control_freq,
         reward_shaping=True,  # Enable dense rewards
         # reward_shaping=False,
     )
     
-    # Reset the environment
+    # Reset the environments
     obs = env.reset()
     
     # Run a random policy to demonstrate dense rewards
-    rewards = []
+    rewards = np.empty((args.steps, args.n_envs), dtype=np.float32)
+    n = 0
+    action = np.tile(_DUMMY_ACTION, (args.n_envs, 1))
+    log_lines = []
+    completed = False
     for i in range(args.steps):
-        # Random action
-        action = get_libero_dummy_action()
-        
-        # Step the environment
+        # Step the environments
         obs, reward, done, info = env.step(action)
-        rewards.append(reward)
+        rewards[i] = reward
+        n = i + 1
         
-        print(f"Step {i}, Reward: {reward:.4f}")
+        log_lines.append(f"Step {i}, Reward: {np.array2string(reward, precision=4)}")
+        if len(log_lines) >= args.log_every:
+            print("\n".join(log_lines))
+            log_lines.clear()
         
-        # Break if the task is completed
-        if done:
-            print("Task completed!")
+        # Break if the task is completed in every environment
+        if done.all():
+            completed = True
             break
+    if log_lines:
+        print("\n".join(log_lines))
+    if completed:
+        print("Task completed!")
+    rewards = rewards[:n]
+
+    # Shut down the worker processes
+    env.close()
     
     # Plot the reward curve if matplotlib is available
     # try:
@@ -63,8 +77,6 @@ def main(args):
     #     print("Reward plot saved as dense_reward_plot.png")
     # except ImportError:
     #     print("Matplotlib not available for plotting.")
-    
-    env.close()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -73,6 +85,9 @@ if __name__ == "__main__":
     parser.add_argument("--task_id", type=int, default=0)
     parser.add_argument("--control_freq", type=int, default=20)
     parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--n_envs", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log_every", type=int, default=10)
     args = parser.parse_args()
     
     main(args) 
\ No newline at end of file
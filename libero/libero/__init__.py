@@ -1,5 +1,5 @@
+import functools
 import os
-import yaml
 
 # This is a default path for localizing all the benchmark related files
 libero_config_path = os.environ.get(
@@ -7,6 +7,13 @@ libero_config_path = os.environ.get(
 )
 config_file = os.path.join(libero_config_path, "config.yaml")
 
+# Parsed config file, keyed by (config_file, mtime) so edits on disk are picked up
+_CONFIG_CACHE = {}
+# Set once the config file is known to exist
+_CONFIG_READY = False
+# The "path exists" check only needs to run once per process (and again after the paths are reset)
+_CONFIG_VALIDATED = False
+
 
 def get_default_path_dict(custom_location=None):
     if custom_location is None:
@@ -15,16 +22,16 @@ def get_default_path_dict(custom_location=None):
         benchmark_root_path = custom_location
 
     # This is a default path for localizing all the default bddl files
-    bddl_files_default_path = os.path.join(benchmark_root_path, "./bddl_files")
+    bddl_files_default_path = os.path.join(benchmark_root_path, "bddl_files")
 
     # This is a default path for localizing all the default bddl files
-    init_states_default_path = os.path.join(benchmark_root_path, "./init_files")
+    init_states_default_path = os.path.join(benchmark_root_path, "init_files")
 
     # This is a default path for localizing all the default datasets
     dataset_default_path = os.path.join(benchmark_root_path, "../datasets")
 
     # This is a default path for localizing all the default assets
-    assets_default_path = os.path.join(benchmark_root_path, "./assets")
+    assets_default_path = os.path.join(benchmark_root_path, "assets")
 
     return {
         "benchmark_root": benchmark_root_path,
@@ -35,15 +42,98 @@ def get_default_path_dict(custom_location=None):
     }
 
 
-def get_libero_path(query_key):
-    with open(config_file, "r") as f:
-        config = dict(yaml.load(f.read(), Loader=yaml.FullLoader))
+@functools.lru_cache(maxsize=None)
+def _yaml_codec():
+    """Import PyYAML on first use, preferring the LibYAML-backed safe loader/dumper."""
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+def _ensure_config():
+    """
+    Create the config file on first use. Set ``LIBERO_NONINTERACTIVE=1`` to skip the
+    dataset-path prompt and write the default paths (e.g. in worker processes or CI).
+    """
+    global _CONFIG_READY
+    if _CONFIG_READY:
+        return
+    os.makedirs(libero_config_path, exist_ok=True)
+
+    if not os.path.exists(config_file):
+        # Create a default config file
+
+        default_path_dict = get_default_path_dict()
+        answer = "n" if os.environ.get("LIBERO_NONINTERACTIVE") == "1" else input(
+            "Do you want to specify a custom path for the dataset folder? (Y/N): "
+        ).lower()
+        if answer == "y":
+            # If the user wants to specify a custom storage path, prompt them to enter it
+            custom_dataset_path = input(
+                "Enter the path where you want to store the datasets: "
+            )
+            full_custom_dataset_path = os.path.join(
+                os.path.abspath(os.path.expanduser(custom_dataset_path)), "datasets"
+            )
+            # Check if the custom storage path exists, and create if it doesn't
+
+            print("The full path of the custom storage path you entered is:")
+            print(full_custom_dataset_path)
+            print("Do you want to continue? (Y/N)")
+            confirm_answer = input().lower()
+            if confirm_answer == "y":
+                if not os.path.exists(full_custom_dataset_path):
+                    os.makedirs(full_custom_dataset_path)
+                default_path_dict["datasets"] = full_custom_dataset_path
+        print("Initializing the default config file...")
+        print(f"The following information is stored in the config file: {config_file}")
+        # write all the paths into a yaml file
+        _save_config(default_path_dict)
+        for key, value in default_path_dict.items():
+            print(f"{key}: {value}")
+    _CONFIG_READY = True
+
+
+def _load_config():
+    """Return the parsed config file, reading it from disk only when it changed."""
+    global _CONFIG_VALIDATED
+    _ensure_config()
+    key = (config_file, os.stat(config_file).st_mtime_ns)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        yaml, loader, _ = _yaml_codec()
+        with open(config_file, "r") as f:
+            config = dict(yaml.load(f, Loader=loader))
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = config
 
     # Give warnings in case the user needs to access the paths
-    for key in config:
-        if not os.path.exists(config[key]):
-            print(f"[Warning]: {key} path {config[key]} does not exist!")
+    if not _CONFIG_VALIDATED:
+        for path_key in config:
+            if not os.path.exists(config[path_key]):
+                print(f"[Warning]: {path_key} path {config[path_key]} does not exist!")
+        _CONFIG_VALIDATED = True
+    return config
+
+
+def _save_config(config):
+    """Write ``config`` to the config file and make it the cached copy."""
+    global _CONFIG_VALIDATED
+    yaml, _, dumper = _yaml_codec()
+    os.makedirs(libero_config_path, exist_ok=True)
+    with open(config_file, "w") as f:
+        yaml.dump(config, f, Dumper=dumper)
+    _CONFIG_CACHE.clear()
+    _CONFIG_CACHE[(config_file, os.stat(config_file).st_mtime_ns)] = dict(config)
+    _CONFIG_VALIDATED = False
+
 
+def get_libero_path(query_key):
+    config = _load_config()
     assert (
         query_key in config
     ), f"Key {query_key} not found in config file {config_file}. You need to modify it. Available keys are: {config.keys()}"
@@ -54,9 +144,85 @@ def set_libero_default_path(custom_location=os.path.dirname(os.path.abspath(__fi
     print(
         f"[Warning] You are changing the default path for Libero config. This will affect all the paths in the config file."
     )
-    new_config = get_default_path_dict(custom_location)
-    with open(config_file, "w") as f:
-        yaml.dump(new_config, f)
+    _save_config(get_default_path_dict(custom_location))
+
+
+# Benchmark folders are searched in this order; any other folders under bddl_files come after
+_BDDL_FOLDER_ORDER = ("libero_10", "libero_90", "libero_spatial", "libero_object", "libero_goal")
+
+
+@functools.lru_cache(maxsize=1)
+def _bddl_index(bddl_root):
+    """Map every task name under ``bddl_root`` to its BDDL file path (one directory level deep)."""
+    folders = {entry.name: entry.path for entry in os.scandir(bddl_root) if entry.is_dir()}
+    ordered = [name for name in _BDDL_FOLDER_ORDER if name in folders]
+    ordered += sorted(name for name in folders if name not in _BDDL_FOLDER_ORDER)
+
+    index = {}
+    for folder_name in ordered:
+        for entry in os.scandir(folders[folder_name]):
+            if entry.name.endswith(".bddl"):
+                index.setdefault(entry.name[: -len(".bddl")], entry.path)
+    return index
+
+
+# Resolved on first use: env_wrapper pulls in robosuite/MuJoCo, which we don't want at import time
+_OffScreenRenderEnv = None
+_SubprocVectorEnv = None
+_get_benchmark = None
+
+
+def _lazy_imports():
+    global _OffScreenRenderEnv, _SubprocVectorEnv, _get_benchmark
+    if _OffScreenRenderEnv is None:
+        from libero.libero.benchmark import get_benchmark
+        from libero.libero.envs.env_wrapper import OffScreenRenderEnv
+        from libero.libero.envs.venv import SubprocVectorEnv
+
+        _get_benchmark = get_benchmark
+        _SubprocVectorEnv = SubprocVectorEnv
+        _OffScreenRenderEnv = OffScreenRenderEnv
+
+
+@functools.lru_cache(maxsize=None)
+def _benchmark_instance(benchmark_name):
+    _lazy_imports()
+    return _get_benchmark(benchmark_name)()
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_bddl_in(bddl_root, task, task_id, benchmark):
+    if benchmark is not None and task_id is not None:
+        # If benchmark and task_id are provided, get the task information from the benchmark
+        task_obj = _benchmark_instance(benchmark).get_task(i=task_id)
+        return os.path.join(bddl_root, task_obj.problem_folder, task_obj.bddl_file)
+
+    # Otherwise, look the task name up in the benchmark folders under bddl_files
+    try:
+        bddl_file_path = _bddl_index(bddl_root).get(task)
+    except (FileNotFoundError, NotADirectoryError):
+        # bddl_root itself is missing (not cached, so it is rescanned once it exists)
+        bddl_file_path = None
+    if bddl_file_path is None:
+        # If not found in benchmark folders, try direct path
+        bddl_file_path = os.path.join(bddl_root, f"{task}.bddl")
+        if not os.path.exists(bddl_file_path):
+            raise FileNotFoundError(f"Could not find BDDL file for task {task}")
+    return bddl_file_path
+
+
+def _resolve_bddl(task, task_id=None, benchmark=None):
+    # The mapping is fixed for a given bddl_files root, so it is cached per root
+    return _resolve_bddl_in(get_libero_path("bddl_files"), task, task_id, benchmark)
+
+
+def _get_env_args(bddl_file_path, kwargs):
+    return {
+        "bddl_file_name": bddl_file_path,
+        "camera_heights": 128,
+        "camera_widths": 128,
+        **kwargs  # Add any additional arguments
+    }
 
 
 def get_env_from_task(task, task_id=None, benchmark=None, **kwargs):
@@ -72,84 +238,66 @@ def get_env_from_task(task, task_id=None, benchmark=None, **kwargs):
     Returns:
         OffScreenRenderEnv: The environment instance
     """
-    from libero.libero.benchmark import get_benchmark, get_task
-    from libero.libero.envs.env_wrapper import OffScreenRenderEnv
-    
-    # Get BDDL file path
-    if benchmark is not None and task_id is not None:
-        # If benchmark and task_id are provided, get the task information from the benchmark
-        benchmark_obj = get_benchmark(benchmark)
-        benchmark_instance = benchmark_obj()  # Create an instance of the benchmark
-        task_obj = benchmark_instance.get_task(i=task_id)
-        bddl_file_path = os.path.join(
-            get_libero_path("bddl_files"),
-            task_obj.problem_folder,
-            task_obj.bddl_file
-        )
-    else:
-        # Otherwise, construct the path from the task name
-        # This assumes the task name follows the convention and is in one of the standard benchmark folders
-        for benchmark_folder in ["libero_10", "libero_90", "libero_spatial", "libero_object", "libero_goal"]:
-            potential_path = os.path.join(
-                get_libero_path("bddl_files"),
-                benchmark_folder,
-                f"{task}.bddl"
-            )
-            if os.path.exists(potential_path):
-                bddl_file_path = potential_path
-                break
-        else:
-            # If not found in standard folders, try direct path
-            bddl_file_path = os.path.join(
-                get_libero_path("bddl_files"),
-                f"{task}.bddl"
-            )
-            if not os.path.exists(bddl_file_path):
-                raise FileNotFoundError(f"Could not find BDDL file for task {task}")
-    
-    # Create environment
-    env_args = {
-        "bddl_file_name": bddl_file_path,
-        "camera_heights": 128,
-        "camera_widths": 128,
-        **kwargs  # Add any additional arguments
-    }
-    
-    return OffScreenRenderEnv(**env_args)
+    _lazy_imports()
+    bddl_file_path = _resolve_bddl(task, task_id, benchmark)
+    return _OffScreenRenderEnv(**_get_env_args(bddl_file_path, kwargs))
 
 
-if not os.path.exists(libero_config_path):
-    os.makedirs(libero_config_path)
+def make_env_factory(benchmark, **kwargs):
+    """
+    Build a function that creates environments for tasks of one benchmark.
 
-if not os.path.exists(config_file):
-    # Create a default config file
+    The benchmark, the bddl_files root and the environment arguments are resolved once, so
+    creating many environments (e.g. for parallel rollouts) only looks up the task per call.
 
-    default_path_dict = get_default_path_dict()
-    answer = input(
-        "Do you want to specify a custom path for the dataset folder? (Y/N): "
-    ).lower()
-    if answer == "y":
-        # If the user wants to specify a custom storage path, prompt them to enter it
-        custom_dataset_path = input(
-            "Enter the path where you want to store the datasets: "
-        )
-        full_custom_dataset_path = os.path.join(
-            os.path.abspath(os.path.expanduser(custom_dataset_path)), "datasets"
+    Args:
+        benchmark (str): Benchmark name (e.g., 'libero_10')
+        **kwargs: Additional arguments to pass to every environment
+
+    Returns:
+        Callable[[int], OffScreenRenderEnv]: Maps a task ID in the benchmark to a new environment
+    """
+    _lazy_imports()
+    env_cls = _OffScreenRenderEnv
+    bench = _benchmark_instance(benchmark)
+    bddl_root = get_libero_path("bddl_files")
+    base_kwargs = {"camera_heights": 128, "camera_widths": 128, **kwargs}
+
+    def factory(task_id):
+        task_obj = bench.get_task(i=task_id)
+        return env_cls(
+            bddl_file_name=os.path.join(
+                bddl_root, task_obj.problem_folder, task_obj.bddl_file
+            ),
+            **base_kwargs,
         )
-        # Check if the custom storage path exists, and create if it doesn't
-
-        print("The full path of the custom storage path you entered is:")
-        print(full_custom_dataset_path)
-        print("Do you want to continue? (Y/N)")
-        confirm_answer = input().lower()
-        if confirm_answer == "y":
-            if not os.path.exists(full_custom_dataset_path):
-                os.makedirs(full_custom_dataset_path)
-            default_path_dict["datasets"] = full_custom_dataset_path
-    print("Initializing the default config file...")
-    print(f"The following information is stored in the config file: {config_file}")
-    # write all the paths into a yaml file
-    with open(config_file, "w") as f:
-        yaml.dump(default_path_dict, f)
-    for key, value in default_path_dict.items():
-        print(f"{key}: {value}")
+
+    return factory
+
+
+def get_vec_env_from_task(task, n_envs, task_id=None, benchmark=None, seed=0, **kwargs):
+    """
+    Create ``n_envs`` copies of a task environment, each stepped in its own worker process.
+
+    The BDDL file is resolved once in the parent process, so workers only construct the environment.
+
+    Args:
+        task (str): Task name
+        n_envs (int): Number of parallel environments
+        task_id (int, optional): Task ID in the benchmark
+        benchmark (str, optional): Benchmark name (e.g., 'libero_10')
+        seed (int, optional): Environment ``i`` is seeded with ``seed + i``. The workers are
+            forked from this process and would otherwise share one RNG state, i.e. all roll
+            out identically.
+        **kwargs: Additional arguments to pass to each environment
+
+    Returns:
+        SubprocVectorEnv: The vectorized environment. ``step`` takes an ``(n_envs, action_dim)``
+            array and returns stacked ``(obs, reward, done, info)``.
+    """
+    _lazy_imports()
+    env_args = _get_env_args(_resolve_bddl(task, task_id, benchmark), kwargs)
+    env_cls = _OffScreenRenderEnv
+    vec_env = _SubprocVectorEnv([lambda: env_cls(**env_args) for _ in range(n_envs)])
+    vec_env.seed(seed)
+    return vec_env
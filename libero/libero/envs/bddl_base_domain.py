@@ -1,13 +1,18 @@
+import itertools
+import math
 import numpy as np
 import os
+import pickle
+import sys
+import warnings
 import robosuite.utils.transform_utils as T
 
-from copy import deepcopy
 from robosuite.environments.manipulation.single_arm_env import SingleArmEnv
 from robosuite.models.tasks import ManipulationTask
 from robosuite.utils.placement_samplers import SequentialCompositeSampler
 from robosuite.utils.observables import Observable, sensor
 from robosuite.utils.mjcf_utils import CustomMaterial
+from robosuite.utils.numba import jit_decorator
 import robosuite.macros as macros
 
 import mujoco
@@ -28,10 +33,195 @@ DIR_PATH = os.path.dirname(os.path.realpath(__file__))
 
 TASK_MAPPING = {}
 
+# Read-only fallbacks returned by the object sensors before their inputs are in obs_cache
+_ZERO3 = np.zeros(3)
+_ZERO3.setflags(write=False)
+_ZERO4 = np.zeros(4)
+_ZERO4.setflags(write=False)
+
+# Parsed bddl problems keyed by (absolute path, mtime). Parsing with pyparsing dominates env
+# construction, so each file is parsed once per process and also pickled next to the bddl file.
+_PARSED_CACHE = {}
+# Bump whenever robosuite_parse_problem (or anything it calls) changes its output, so stale
+# .parsed.pkl sidecars are reparsed instead of being trusted by mtime alone
+_PARSED_FORMAT_VERSION = 1
+
 
 def register_problem(target_class):
     """We design the mapping to be case-INsensitive."""
-    TASK_MAPPING[target_class.__name__.lower()] = target_class
+    # Interned so that the per-construction problem name check compares by identity
+    key = sys.intern(target_class.__name__.casefold())
+    target_class._problem_name_key = key
+    TASK_MAPPING[key] = target_class
+
+
+@jit_decorator
+def _prog_on(pos1, pos2, max_dist):
+    """Progress for "on": horizontal alignment of the two positions, 1 when aligned."""
+    horizontal_dist = math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
+    if horizontal_dist >= max_dist:
+        return 0.0
+    return 1.0 - horizontal_dist / max_dist
+
+
+@jit_decorator
+def _prog_in(pos1, pos2, max_dist):
+    """Progress for "in": 3D distance between the two positions, 1 when coincident."""
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    dz = pos1[2] - pos2[2]
+    squared_dist = dx * dx + dy * dy + dz * dz
+    # Out of range: skip the square root
+    if squared_dist >= max_dist * max_dist:
+        return 0.0
+    return 1.0 - math.sqrt(squared_dist) / max_dist
+
+
+@jit_decorator
+def _prog_articulated(q_curr, q_target_min, q_target_max, q_opp_min, q_opp_max):
+    """
+    Progress of a joint position from the opposite range towards the target range, in [0, 1].
+    """
+    progress = 0.0
+    # Case 1: Target achieved by qpos decreasing (e.g., Microwave open q < C)
+    # Target range is "to the left" of opposite range.
+    if q_target_max < q_opp_min:
+        denominator = q_opp_max - q_target_max
+        if denominator > 1e-6:
+            progress = (q_opp_max - q_curr) / denominator
+    # Case 2: Target achieved by qpos increasing (e.g., ShortCabinet open q > C)
+    # Target range is "to the right" of opposite range.
+    elif q_target_min > q_opp_max:
+        denominator = q_target_min - q_opp_max
+        if denominator > 1e-6:
+            progress = (q_curr - q_opp_max) / denominator
+    return min(1.0, max(0.0, progress))
+
+
+@jit_decorator
+def _obj_rel_to_eef(pos, quat, ginv):
+    """
+    Pose of an object in the gripper frame.
+
+    Args:
+        pos (np.array): (x,y,z) object position in the world frame
+        quat (np.array): (x,y,z,w) object orientation in the world frame
+        ginv (np.array): 4x4 world pose in the gripper frame (the inverted gripper pose)
+
+    Returns:
+        2-tuple:
+            - (np.array) (x,y,z) object position in the gripper frame
+            - (np.array) (x,y,z,w) float32 object orientation in the gripper frame
+    """
+    # Quaternion to rotation matrix (same as T.quat2mat)
+    x, y, z, w = quat[0], quat[1], quat[2], quat[3]
+    n = x * x + y * y + z * z + w * w
+    rot = np.eye(3)
+    if n > 1e-12:
+        s = 2.0 / n
+        rot[0, 0] = 1.0 - s * (y * y + z * z)
+        rot[0, 1] = s * (x * y - z * w)
+        rot[0, 2] = s * (x * z + y * w)
+        rot[1, 0] = s * (x * y + z * w)
+        rot[1, 1] = 1.0 - s * (x * x + z * z)
+        rot[1, 2] = s * (y * z - x * w)
+        rot[2, 0] = s * (x * z - y * w)
+        rot[2, 1] = s * (y * z + x * w)
+        rot[2, 2] = 1.0 - s * (x * x + y * y)
+
+    # ginv @ [[rot, pos], [0, 1]], written out to stay with 3x3 loops
+    rel_pos = np.empty(3)
+    m = np.empty((3, 3))
+    for i in range(3):
+        rel_pos[i] = (
+            ginv[i, 0] * pos[0] + ginv[i, 1] * pos[1] + ginv[i, 2] * pos[2] + ginv[i, 3]
+        )
+        for j in range(3):
+            m[i, j] = ginv[i, 0] * rot[0, j] + ginv[i, 1] * rot[1, j] + ginv[i, 2] * rot[2, j]
+
+    # Rotation matrix to quaternion, with w >= 0 like T.mat2quat
+    trace = m[0, 0] + m[1, 1] + m[2, 2]
+    if trace > 0.0:
+        s = math.sqrt(trace + 1.0) * 2.0
+        qw = 0.25 * s
+        qx = (m[2, 1] - m[1, 2]) / s
+        qy = (m[0, 2] - m[2, 0]) / s
+        qz = (m[1, 0] - m[0, 1]) / s
+    elif m[0, 0] > m[1, 1] and m[0, 0] > m[2, 2]:
+        s = math.sqrt(1.0 + m[0, 0] - m[1, 1] - m[2, 2]) * 2.0
+        qw = (m[2, 1] - m[1, 2]) / s
+        qx = 0.25 * s
+        qy = (m[0, 1] + m[1, 0]) / s
+        qz = (m[0, 2] + m[2, 0]) / s
+    elif m[1, 1] > m[2, 2]:
+        s = math.sqrt(1.0 + m[1, 1] - m[0, 0] - m[2, 2]) * 2.0
+        qw = (m[0, 2] - m[2, 0]) / s
+        qx = (m[0, 1] + m[1, 0]) / s
+        qy = 0.25 * s
+        qz = (m[1, 2] + m[2, 1]) / s
+    else:
+        s = math.sqrt(1.0 + m[2, 2] - m[0, 0] - m[1, 1]) * 2.0
+        qw = (m[1, 0] - m[0, 1]) / s
+        qx = (m[0, 2] + m[2, 0]) / s
+        qy = (m[1, 2] + m[2, 1]) / s
+        qz = 0.25 * s
+    if qw < 0.0:
+        qx, qy, qz, qw = -qx, -qy, -qz, -qw
+    rel_quat = np.empty(4, dtype=np.float32)
+    rel_quat[0] = qx
+    rel_quat[1] = qy
+    rel_quat[2] = qz
+    rel_quat[3] = qw
+    return rel_pos, rel_quat
+
+
+def load_parsed_problem(bddl_file_name):
+    """
+    Parse a bddl file, reusing an earlier parse of the same (unmodified) file when possible.
+
+    The returned dict is shared between environments and should be treated as read-only.
+    """
+    mtime = os.path.getmtime(bddl_file_name)
+    key = (os.path.abspath(bddl_file_name), mtime)
+    parsed_problem = _PARSED_CACHE.get(key)
+    if parsed_problem is not None:
+        return parsed_problem
+
+    sidecar_file = bddl_file_name + ".parsed.pkl"
+    try:
+        with open(sidecar_file, "rb") as f:
+            sidecar = pickle.load(f)
+        if (
+            sidecar["version"] == _PARSED_FORMAT_VERSION
+            and sidecar["mtime"] == mtime
+        ):
+            parsed_problem = sidecar["parsed_problem"]
+    except Exception:
+        # Missing, stale, corrupt or foreign sidecar: fall back to parsing the bddl file
+        parsed_problem = None
+
+    if parsed_problem is None:
+        parsed_problem = BDDLUtils.robosuite_parse_problem(bddl_file_name)
+        try:
+            # Write then rename, so parallel workers never read a partial sidecar
+            tmp_file = f"{sidecar_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "wb") as f:
+                pickle.dump(
+                    {
+                        "version": _PARSED_FORMAT_VERSION,
+                        "mtime": mtime,
+                        "parsed_problem": parsed_problem,
+                    },
+                    f,
+                )
+            os.replace(tmp_file, sidecar_file)
+        except OSError:
+            # e.g. a read-only install; the in-memory cache still applies
+            pass
+
+    parsed_problem["problem_name"] = sys.intern(parsed_problem["problem_name"])
+    _PARSED_CACHE[key] = parsed_problem
+    return parsed_problem
 
 
 class BDDLBaseDomain(SingleArmEnv):
@@ -39,6 +229,46 @@ class BDDLBaseDomain(SingleArmEnv):
     A base domain for parsing bddl files.
     """
 
+    # arena_type -> (robot base_xpos_offset key, arena class, attribute holding the table size
+    # or None if the offset is not size dependent, whether the arena takes the table size and
+    # workspace offset, extra arena kwargs)
+    _ARENA_TABLE = {
+        "table": (
+            "table",
+            TableArena,
+            "table_full_size",
+            True,
+            {"table_friction": (0.6, 0.005, 0.0001)},
+        ),
+        "kitchen": ("kitchen_table", KitchenTableArena, "kitchen_table_full_size", True, {}),
+        "floor": ("empty", EmptyArena, None, False, {}),
+        "coffee_table": ("coffee_table", CoffeeTableArena, "coffee_table_full_size", False, {}),
+        "living_room": (
+            "living_room_table",
+            LivingRoomTableArena,
+            "living_room_table_full_size",
+            False,
+            {},
+        ),
+        "study": ("study_table", StudyTableArena, "study_table_full_size", False, {}),
+    }
+
+    # Articulated unary predicates for reward shaping: (target ranges key, opposite ranges key)
+    _ART_PRED_MAP = {
+        "open": ("default_open_ranges", "default_close_ranges"),
+        "close": ("default_close_ranges", "default_open_ranges"),
+        "turnon": ("default_turnon_ranges", "default_turnoff_ranges"),
+        "turnoff": ("default_turnoff_ranges", "default_turnon_ranges"),
+    }
+
+    # Articulated initial-state predicates: (property sampler, joint ranges key)
+    _ART_INIT_SAMPLERS = {
+        "open": (OpenCloseSampler, "default_open_ranges"),
+        "close": (OpenCloseSampler, "default_close_ranges"),
+        "turnon": (TurnOnOffSampler, "default_turnon_ranges"),
+        "turnoff": (TurnOnOffSampler, "default_turnoff_ranges"),
+    }
+
     def __init__(
         self,
         bddl_file_name,
@@ -85,6 +315,12 @@ class BDDLBaseDomain(SingleArmEnv):
         self.reward_shaping = reward_shaping
         # Variable to track initial reward value
         self.initial_reward_value = None
+        # Goal distance at the previous step, used by the dense reward
+        self.previous_distance = None
+        # Goal predicate results shared by reward() and the done check; only set during step()
+        self._predicate_sat_cache = None
+        # Trimmed action when a 7-dim action is passed to a 4-dim OSC_POSITION controller
+        self._action4 = np.empty(4)
 
         # whether to use ground-truth object states
         self.use_object_obs = use_object_obs
@@ -95,11 +331,12 @@ class BDDLBaseDomain(SingleArmEnv):
         self.conditional_placement_on_objects_initializer = None
 
         # object property initializer
-
-        if object_property_initializers is not None:
-            self.object_property_initializers = object_property_initializers
-        else:
-            self.object_property_initializers = list()
+        # (copied, since initializers from the bddl file are appended to this list)
+        self.object_property_initializers = (
+            list(object_property_initializers)
+            if object_property_initializers is not None
+            else []
+        )
 
         # Keep track of movable objects in the tasks
         self.objects_dict = {}
@@ -114,8 +351,7 @@ class BDDLBaseDomain(SingleArmEnv):
 
         # For those that require visual feature changes, update the state every time step to avoid missing state changes. We keep track of this type of objects to make predicate checking more efficient.
         self.tracking_object_states_change = []
-
-        self.object_sites_dict = {}
+        self._update_state_fns = []
 
         self.objects = []
         self.fixtures = []
@@ -124,9 +360,14 @@ class BDDLBaseDomain(SingleArmEnv):
         self.custom_asset_dir = os.path.abspath(os.path.join(DIR_PATH, "../assets"))
 
         self.bddl_file_name = bddl_file_name
-        self.parsed_problem = BDDLUtils.robosuite_parse_problem(self.bddl_file_name)
+        self.parsed_problem = load_parsed_problem(self.bddl_file_name)
 
         self.obj_of_interest = self.parsed_problem["obj_of_interest"]
+        # Goal predicates, looked up on every dense reward computation
+        self._goal_state = tuple(
+            tuple(state) for state in self.parsed_problem.get("goal_state") or ()
+        )
+        self._n_goals = len(self._goal_state)
 
         self._assert_problem_name()
 
@@ -181,8 +422,8 @@ class BDDLBaseDomain(SingleArmEnv):
             reward = self._compute_dense_reward()
 
         # Scale reward if requested
-        if self.reward_scale is not None:
-            reward *= self.reward_scale / 1.0
+        if self.reward_scale is not None and self.reward_scale != 1.0:
+            reward *= self.reward_scale
 
         return reward
 
@@ -195,54 +436,87 @@ class BDDLBaseDomain(SingleArmEnv):
         Returns:
             float: A reward value representing progress toward the goal
         """
-        goal_state = self.parsed_problem["goal_state"]
-
-        # print(f"goal_state: {goal_state}")
-
-        if not goal_state:
+        if not self.reward_shaping or self._n_goals == 0:
             return 0.0
+        goal_state = self._goal_state
             
         # Calculate distance for each goal condition (lower is better)
         # We use 1-progress as our distance metric (so 0 means achieved)
-        distances = []
-        for state in goal_state:
-            progress = self._get_predicate_progress(state)
-            distance = 1.0 - progress  # Convert progress to distance
-            distances.append(distance)
+        # Satisfied goals are at distance 0, so progress is only computed for the rest
+        satisfied = self._batch_predicate_sat(goal_state)
+        distances = np.zeros(self._n_goals)
+        for i in np.flatnonzero(~satisfied):
+            distances[i] = 1.0 - self._get_predicate_progress(
+                goal_state[i], check_satisfied=False
+            )
             
         # Use the maximum distance as the overall distance (bottleneck approach)
         # This ensures all conditions need to be satisfied
-        current_distance = max(distances) if distances else 1.0
+        current_distance = float(distances.max())
         
         # Initialize the previous distance value if not yet set
-        if not hasattr(self, 'previous_distance'):
+        if self.previous_distance is None:
             self.previous_distance = current_distance
             return 0.0
             
-        # Calculate difference in distance (negative means we got closer to goal)
-        distance_diff = self.previous_distance - current_distance
-        reward = distance_diff
+        # Calculate difference in distance (positive means we got closer to goal),
+        # clipped to [0, 1]. Scaling is left to reward().
+        reward = self.previous_distance - current_distance
+        reward = 0.0 if reward < 0.0 else (1.0 if reward > 1.0 else reward)
         
         # Store current distance for next step
         self.previous_distance = current_distance
-        
-        # Scale reward if requested
-        if self.reward_scale is not None:
-            reward *= self.reward_scale / 1.0
 
-        # clip very small values to 0
-        reward = np.clip(reward, 0.0, 1.0)
-        if np.abs(reward) < 1e-3:
-            reward = 0.0
-        
-        return reward
+        # very small values count as no progress
+        return reward if reward >= 1e-3 else 0.0
+
+    def _batch_predicate_sat(self, states):
+        """
+        Evaluate a sequence of predicates on the current simulation state.
+
+        Within a step() call the result is memoized, so the reward and the done check
+        evaluate the goal predicates only once.
+
+        Args:
+            states (tuple): Predicate expressions, each a tuple (predicate_name, arg1[, arg2])
+
+        Returns:
+            np.array: Boolean mask, True where the predicate holds
+        """
+        cache = self._predicate_sat_cache
+        if cache is not None and states in cache:
+            return cache[states]
+
+        satisfied = np.empty(len(states), dtype=bool)
+        for i, state in enumerate(states):
+            satisfied[i] = self._eval_predicate(state)
+        if cache is not None:
+            cache[states] = satisfied
+        return satisfied
+
+    def _eval_predicate(self, state):
+        """
+        Evaluate a single predicate expression. Override this in the problem class to customize
+        how goal predicates are checked; it is used by both _check_success and reward shaping.
+
+        Args:
+            state (tuple): A predicate expression (predicate_name, arg1[, arg2])
 
-    def _get_predicate_progress(self, state):
+        Returns:
+            bool: True if the predicate holds
+        """
+        return eval_predicate_fn(
+            state[0], *[self.object_states_dict[name] for name in state[1:]]
+        )
+
+    def _get_predicate_progress(self, state, check_satisfied=True):
         """
         Calculate progress toward satisfying a predicate.
         
         Args:
             state: A predicate expression [predicate_name, arg1, arg2]
+            check_satisfied (bool): Return 1.0 right away if the predicate already holds.
+                Callers that already evaluated the predicate can skip the check.
             
         Returns:
             float: A value between 0 and 1 representing progress
@@ -258,37 +532,27 @@ class BDDLBaseDomain(SingleArmEnv):
             obj2 = self.object_states_dict[object_2_name]
             
             # If predicate is already satisfied, return 1.0
-            if eval_predicate_fn(predicate_fn_name, obj1, obj2):
+            if check_satisfied and eval_predicate_fn(predicate_fn_name, obj1, obj2):
                 return 1.0
                 
             # Otherwise calculate distance-based progress for common predicates
             if predicate_fn_name.lower() == "on":
                 # Calculate normalized distance-based progress for "on" predicate
-                pos1 = obj1.get_geom_state()["pos"]
-                pos2 = obj2.get_geom_state()["pos"]
-                
                 # For "on" we need horizontal alignment and appropriate height
-                horizontal_dist = ((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)**0.5
-                
-                # Normalize distances (clamp to reasonable values)
-                max_horizontal_dist = 1.0  # 1 meter as maximum relevant distance
-                normalized_horiz = max(0.0, 1.0 - horizontal_dist / max_horizontal_dist)
+                pos1 = self._get_predicate_pos(object_1_name)
+                pos2 = self._get_predicate_pos(object_2_name)
                 
-                # Return progress value biased toward horizontal alignment
-                return normalized_horiz
+                # 1 meter as maximum relevant distance
+                return _prog_on(pos1, pos2, 1.0)
         
             elif predicate_fn_name.lower() == "in":
                 # Calculate normalized distance-based progress for "in" predicate
-                pos1 = obj1.get_geom_state()["pos"]
-                pos2 = obj2.get_geom_state()["pos"]
-                
                 # For "in" we need the object to be positioned inside the container
-                dist = ((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2 + (pos1[2] - pos2[2])**2)**0.5
+                pos1 = self._get_predicate_pos(object_1_name)
+                pos2 = self._get_predicate_pos(object_2_name)
                 
-                # Normalize distance (clamp to reasonable values)
-                max_dist = 1.0  # 1 meter as maximum relevant distance
-                normalized_dist = max(0.0, 1.0 - dist / max_dist)
-                return normalized_dist
+                # 1 meter as maximum relevant distance
+                return _prog_in(pos1, pos2, 1.0)
             
             else:
                 raise NotImplementedError(f"Reward shaping for predicate {predicate_fn_name} not implemented")
@@ -301,135 +565,49 @@ class BDDLBaseDomain(SingleArmEnv):
             obj_state = self.object_states_dict[object_name] # This is an ObjectState instance
 
             # First, check if the predicate is already true
-            if eval_predicate_fn(predicate_fn_name_orig_case, obj_state):
+            if check_satisfied and eval_predicate_fn(predicate_fn_name_orig_case, obj_state):
                 return 1.0
 
-            progress = 0.0
-
-            # Handling for "open" and "close" predicates
-            if predicate_fn_name_lower in ["open", "close"]:
-                # These predicates only apply to ArticulatedObjects with ObjectState
-                obj = self.get_object(object_name)
-                if not isinstance(obj_state, ObjectState) or not isinstance(obj, ArticulatedObject):
-                    return 0.0 # Not an articulated object, so cannot be opened/closed in this context
-
-                # Get joint state - use get_joint_state method instead of directly accessing qpos
-                joint_states = obj_state.get_joint_state()
-                if not joint_states:  # Empty list means no joints
-                    return 0.0
-                
-                q_curr = joint_states[0]  # Use the first joint position
-                
-                if not hasattr(obj, "object_properties") or \
-                   "articulation" not in obj.object_properties:
-                    return 0.0
-
-                art_props = obj.object_properties["articulation"]
-                
-                target_ranges_key_suffix = predicate_fn_name_lower + "_ranges"
-                opposite_ranges_key_suffix = "close_ranges" if predicate_fn_name_lower == "open" else "open_ranges"
-
-                default_target_ranges_key = "default_" + target_ranges_key_suffix
-                default_opposite_ranges_key = "default_" + opposite_ranges_key_suffix
-
-                if default_target_ranges_key not in art_props or \
-                   default_opposite_ranges_key not in art_props:
-                    return 0.0
-
-                target_ranges = art_props[default_target_ranges_key]
-                opposite_ranges = art_props[default_opposite_ranges_key]
-
-                q_target_min_val = min(target_ranges)
-                q_target_max_val = max(target_ranges)
-                q_opp_min_val = min(opposite_ranges)
-                q_opp_max_val = max(opposite_ranges)
-
-                current_progress = 0.0
-                # Case 1: Target achieved by qpos decreasing (e.g., Microwave open q < C)
-                # Target range is "to the left" of opposite range.
-                if q_target_max_val < q_opp_min_val:
-                    q_target_entry = q_target_max_val
-                    q_opposite_extreme = q_opp_max_val
-                    denominator = q_opposite_extreme - q_target_entry
-                    if denominator > 1e-6:
-                        current_progress = (q_opposite_extreme - q_curr) / denominator
-                # Case 2: Target achieved by qpos increasing (e.g., ShortCabinet open q > C)
-                # Target range is "to the right" of opposite range.
-                elif q_target_min_val > q_opp_max_val:
-                    q_target_entry = q_target_min_val
-                    q_opposite_extreme = q_opp_max_val
-                    denominator = q_target_entry - q_opposite_extreme
-                    if denominator > 1e-6:
-                        current_progress = (q_curr - q_opposite_extreme) / denominator
-                
-                progress = np.clip(current_progress, 0.0, 1.0)
-                            
-            # Handling for "turnon" and "turnoff" predicates
-            elif predicate_fn_name_lower in ["turnon", "turnoff"]:
-                # These predicates only apply to ArticulatedObjects with ObjectState
-                obj = self.get_object(object_name)
-                if not isinstance(obj_state, ObjectState) or not isinstance(obj, ArticulatedObject):
-                    return 0.0 # Not an articulated object, so cannot be turned on/off
-
-                # Get joint state - use get_joint_state method instead of directly accessing qpos
-                joint_states = obj_state.get_joint_state()
-                if not joint_states:  # Empty list means no joints
-                    return 0.0
-                
-                q_curr = joint_states[0]  # Use the first joint position
-                
-                if not hasattr(obj, "object_properties") or \
-                   "articulation" not in obj.object_properties:
-                    return 0.0
-                
-                art_props = obj.object_properties["articulation"]
-
-                target_ranges_key_suffix = predicate_fn_name_lower + "_ranges"
-                opposite_ranges_key_suffix = "turnoff_ranges" if predicate_fn_name_lower == "turnon" else "turnon_ranges"
-
-                default_target_ranges_key = "default_" + target_ranges_key_suffix
-                default_opposite_ranges_key = "default_" + opposite_ranges_key_suffix
+            # Handling for "open"/"close" and "turnon"/"turnoff" predicates
+            if predicate_fn_name_lower not in self._ART_PRED_MAP:
+                raise NotImplementedError(f"Reward shaping for unary predicate '{predicate_fn_name_lower}' not implemented.")
 
-                if default_target_ranges_key not in art_props or \
-                   default_opposite_ranges_key not in art_props:
-                    return 0.0
+            # These predicates only apply to ArticulatedObjects with the matching ranges
+            bounds = self._articulation_bounds.get(object_name, {}).get(
+                predicate_fn_name_lower
+            )
+            if bounds is None:
+                return 0.0 # Not an articulated object, so cannot be opened/closed or turned on/off
 
-                target_ranges = art_props[default_target_ranges_key]
-                opposite_ranges = art_props[default_opposite_ranges_key]
+            # Get joint state - use get_joint_state method instead of directly accessing qpos
+            joint_states = obj_state.get_joint_state()
+            if not joint_states:  # Empty list means no joints
+                return 0.0
 
-                q_target_min_val = min(target_ranges)
-                q_target_max_val = max(target_ranges)
-                q_opp_min_val = min(opposite_ranges)
-                q_opp_max_val = max(opposite_ranges)
-                
-                current_progress = 0.0
-                # Case 1: Target achieved by qpos decreasing (e.g., FlatStove turn_off q < C)
-                if q_target_max_val < q_opp_min_val:
-                    q_target_entry = q_target_max_val
-                    q_opposite_extreme = q_opp_max_val
-                    denominator = q_opposite_extreme - q_target_entry
-                    if denominator > 1e-6:
-                        current_progress = (q_opposite_extreme - q_curr) / denominator
-                # Case 2: Target achieved by qpos increasing (e.g., FlatStove turn_on q > C)
-                elif q_target_min_val > q_opp_max_val:
-                    q_target_entry = q_target_min_val
-                    q_opposite_extreme = q_opp_max_val
-                    denominator = q_target_entry - q_opposite_extreme
-                    if denominator > 1e-6:
-                        current_progress = (q_curr - q_opposite_extreme) / denominator
-
-                progress = np.clip(current_progress, 0.0, 1.0)
-            else:
-                raise NotImplementedError(f"Reward shaping for unary predicate '{predicate_fn_name_lower}' not implemented.")
+            q_curr = joint_states[0]  # Use the first joint position
+            return _prog_articulated(float(q_curr), *bounds)
         else:
             raise NotImplementedError(f"Reward shaping for predicate {state[0]} with arity {len(state)-1} not implemented.")
 
-        return progress
+    def _get_predicate_pos(self, object_name):
+        """Current position of an object, fixture or site used in a goal predicate."""
+        pos = self._pos_by_name.get(object_name)
+        if pos is None:
+            # Sites are not bodies; their position comes from the site frame
+            pos = np.asarray(
+                self.object_states_dict[object_name].get_geom_state()["pos"],
+                dtype=np.float64,
+            )
+        return pos
 
     def _assert_problem_name(self):
         """Implement this to make sure the loaded bddl file has the correct problem name specification."""
+        # Only registered classes carry a precomputed key; subclasses fall back to their own name
+        problem_name_key = vars(self.__class__).get("_problem_name_key")
+        if problem_name_key is None:
+            problem_name_key = self.__class__.__name__.casefold()
         assert (
-            self.parsed_problem["problem_name"] == self.__class__.__name__.lower()
+            self.parsed_problem["problem_name"] == problem_name_key
         ), "Problem name mismatched"
 
     def _load_fixtures_in_arena(self, mujoco_arena):
@@ -451,42 +629,66 @@ class BDDLBaseDomain(SingleArmEnv):
         raise NotImplementedError
 
     def _generate_object_state_wrapper(
-        self, skip_object_names=["main_table", "floor", "countertop", "coffee_table"]
+        self, skip_object_names=frozenset(("main_table", "floor", "countertop", "coffee_table"))
     ):
         object_states_dict = {}
         tracking_object_states_changes = []
-        for object_name in self.objects_dict.keys():
-            if object_name in skip_object_names:
-                continue
-            object_states_dict[object_name] = ObjectState(self, object_name)
-            if (
-                self.objects_dict[object_name].category_name
-                in VISUAL_CHANGE_OBJECTS_DICT
-            ):
-                tracking_object_states_changes.append(object_states_dict[object_name])
-
-        for object_name in self.fixtures_dict.keys():
-            if object_name in skip_object_names:
-                continue
-            object_states_dict[object_name] = ObjectState(
-                self, object_name, is_fixture=True
-            )
-            if (
-                self.fixtures_dict[object_name].category_name
-                in VISUAL_CHANGE_OBJECTS_DICT
-            ):
-                tracking_object_states_changes.append(object_states_dict[object_name])
+        for source_dict, is_fixture in (
+            (self.objects_dict, False),
+            (self.fixtures_dict, True),
+        ):
+            for object_name, obj in source_dict.items():
+                if object_name in skip_object_names:
+                    continue
+                object_state = ObjectState(self, object_name, is_fixture=is_fixture)
+                object_states_dict[object_name] = object_state
+                if obj.category_name in VISUAL_CHANGE_OBJECTS_DICT:
+                    tracking_object_states_changes.append(object_state)
 
-        for object_name in self.object_sites_dict.keys():
+        for object_name, site_object in self.object_sites_dict.items():
             if object_name in skip_object_names:
                 continue
             object_states_dict[object_name] = SiteObjectState(
                 self,
                 object_name,
-                parent_name=self.object_sites_dict[object_name].parent_name,
+                parent_name=site_object.parent_name,
             )
         self.object_states_dict = object_states_dict
         self.tracking_object_states_change = tracking_object_states_changes
+        # Bound update methods, called by _post_process after every step
+        self._update_state_fns = [
+            object_state.update_state for object_state in tracking_object_states_changes
+        ]
+        self._precompute_articulation_bounds()
+
+    def _precompute_articulation_bounds(self):
+        """
+        Freeze the articulation ranges used by reward shaping. The ranges are static object
+        properties, so each predicate maps to (target_min, target_max, opposite_min, opposite_max).
+        """
+        articulation_bounds = {}
+        for object_name in self.object_states_dict:
+            obj = self.get_object(object_name)
+            if not isinstance(obj, ArticulatedObject):
+                continue
+            art_props = getattr(obj, "object_properties", {}).get("articulation")
+            if not art_props:
+                continue
+            bounds = {}
+            for predicate_name, (target_key, opposite_key) in self._ART_PRED_MAP.items():
+                target_ranges = art_props.get(target_key)
+                opposite_ranges = art_props.get(opposite_key)
+                if not target_ranges or not opposite_ranges:
+                    continue
+                bounds[predicate_name] = (
+                    float(min(target_ranges)),
+                    float(max(target_ranges)),
+                    float(min(opposite_ranges)),
+                    float(max(opposite_ranges)),
+                )
+            if bounds:
+                articulation_bounds[object_name] = bounds
+        self._articulation_bounds = articulation_bounds
 
     def _load_distracting_objects(self, mujoco_arena):
         raise NotImplementedError
@@ -539,67 +741,31 @@ class BDDLBaseDomain(SingleArmEnv):
         super()._load_model()
         # Adjust base pose accordingly
 
-        if self._arena_type == "table":
-            xpos = self.robots[0].robot_model.base_xpos_offset["table"](
-                self.table_full_size[0]
-            )
-            self.robots[0].robot_model.set_base_xpos(xpos)
-            mujoco_arena = TableArena(
-                table_full_size=self.table_full_size,
-                table_offset=self.workspace_offset,
-                table_friction=(0.6, 0.005, 0.0001),
-                xml=self._arena_xml,
-                **self._arena_properties,
-            )
-        elif self._arena_type == "kitchen":
-            xpos = self.robots[0].robot_model.base_xpos_offset["kitchen_table"](
-                self.kitchen_table_full_size[0]
-            )
-            self.robots[0].robot_model.set_base_xpos(xpos)
-            mujoco_arena = KitchenTableArena(
-                table_full_size=self.kitchen_table_full_size,
-                table_offset=self.workspace_offset,
-                xml=self._arena_xml,
-                **self._arena_properties,
-            )
-
-        elif self._arena_type == "floor":
-            xpos = self.robots[0].robot_model.base_xpos_offset["empty"]
-            self.robots[0].robot_model.set_base_xpos(xpos)
-
-            mujoco_arena = EmptyArena(
-                xml=self._arena_xml,
-                **self._arena_properties,
-            )
-        elif self._arena_type == "coffee_table":
-            xpos = self.robots[0].robot_model.base_xpos_offset["coffee_table"](
-                self.coffee_table_full_size[0]
-            )
-            self.robots[0].robot_model.set_base_xpos(xpos)
-            mujoco_arena = CoffeeTableArena(
-                xml=self._arena_xml,
-                **self._arena_properties,
-            )
-
-        elif self._arena_type == "living_room":
-            xpos = self.robots[0].robot_model.base_xpos_offset["living_room_table"](
-                self.living_room_table_full_size[0]
-            )
-            self.robots[0].robot_model.set_base_xpos(xpos)
-            mujoco_arena = LivingRoomTableArena(
-                xml=self._arena_xml,
-                **self._arena_properties,
-            )
-
-        elif self._arena_type == "study":
-            xpos = self.robots[0].robot_model.base_xpos_offset["study_table"](
-                self.study_table_full_size[0]
-            )
-            self.robots[0].robot_model.set_base_xpos(xpos)
-            mujoco_arena = StudyTableArena(
-                xml=self._arena_xml,
-                **self._arena_properties,
-            )
+        (
+            base_xpos_key,
+            arena_cls,
+            table_size_attr,
+            uses_table_size,
+            arena_kwargs,
+        ) = self._ARENA_TABLE[self._arena_type]
+        robot_model = self.robots[0].robot_model
+        if table_size_attr is None:
+            xpos = robot_model.base_xpos_offset[base_xpos_key]
+        else:
+            table_full_size = getattr(self, table_size_attr)
+            xpos = robot_model.base_xpos_offset[base_xpos_key](table_full_size[0])
+            if uses_table_size:
+                arena_kwargs = dict(
+                    arena_kwargs,
+                    table_full_size=table_full_size,
+                    table_offset=self.workspace_offset,
+                )
+        robot_model.set_base_xpos(xpos)
+        mujoco_arena = arena_cls(
+            xml=self._arena_xml,
+            **arena_kwargs,
+            **self._arena_properties,
+        )
 
         # Arena always gets set to zero origin
         mujoco_arena.set_origin([0, 0, 0])
@@ -618,6 +784,8 @@ class BDDLBaseDomain(SingleArmEnv):
 
         self._setup_placement_initializer(mujoco_arena)
 
+        self._setup_joint_setters()
+
         self.objects = list(self.objects_dict.values())
         self.fixtures = list(self.fixtures_dict.values())
 
@@ -631,6 +799,26 @@ class BDDLBaseDomain(SingleArmEnv):
         for fixture in self.fixtures:
             self.model.merge_assets(fixture)
 
+    def _setup_joint_setters(self):
+        """
+        Resolve the joint property initializers into (set_joint, sample) pairs, in initializer
+        order. Called from _load_model, since the object states and initializers only change there.
+        """
+        self._joint_setters = []
+        for object_property_initializer in self.object_property_initializers:
+            if isinstance(object_property_initializer, (OpenCloseSampler, TurnOnOffSampler)):
+                self._joint_setters.append(
+                    (
+                        self.object_states_dict[object_property_initializer.name].set_joint,
+                        object_property_initializer.sample,
+                    )
+                )
+            else:
+                warnings.warn(
+                    f"Property initializer {object_property_initializer.name} is not a joint "
+                    "sampler and will not be used"
+                )
+
     def _setup_placement_initializer(self, mujoco_arena):
         self.placement_initializer = SequentialCompositeSampler(name="ObjectSampler")
         self.conditional_placement_initializer = SiteSequentialCompositeSampler(
@@ -641,6 +829,20 @@ class BDDLBaseDomain(SingleArmEnv):
         )
         self._add_placement_initializer()
 
+    def _initialize_sim(self, xml_string=None):
+        super()._initialize_sim(xml_string=xml_string)
+
+        # qpos address of each movable object's free joint (the last one), used on reset
+        # (keyed by obj.name, like the sampled placements). Joint addresses only change
+        # when a new sim is built, so this is not redone on every reset.
+        self._joint_qpos_addr = {
+            obj.name: int(
+                self.sim.model.jnt_qposadr[self.sim.model.joint_name2id(obj.joints[-1])]
+            )
+            for obj in self.objects_dict.values()
+            if obj.joints
+        }
+
     def _setup_references(self):
         """
         Sets up references to important components. A reference is typically an
@@ -662,6 +864,14 @@ class BDDLBaseDomain(SingleArmEnv):
                 fixture_body.root_body
             )
 
+        # Views into MuJoCo's body pose buffers, so object sensors skip the attribute chain
+        self._body_xpos = self.sim.data.body_xpos
+        self._body_xquat = self.sim.data.body_xquat
+        # Rows of body_xpos are views as well, so these always hold the current positions
+        self._pos_by_name = {
+            name: self._body_xpos[body_id] for name, body_id in self.obj_body_id.items()
+        }
+
     def _setup_observables(self):
         """
         Sets up observables to be used for this environment. Creates object-based observables if enabled
@@ -692,15 +902,17 @@ class BDDLBaseDomain(SingleArmEnv):
 
         pf = self.robots[0].robot_model.naming_prefix
 
+        # Computed once per observation update; the object sensors read the result back from
+        # obs_cache["world_pose_in_gripper"] instead of inverting the gripper pose themselves
         @sensor(modality="object")
-        def world_pose_in_gripper(obs_cache):
-            return (
-                T.pose_inv(
-                    T.pose2mat((obs_cache[f"{pf}eef_pos"], obs_cache[f"{pf}eef_quat"]))
+        def world_pose_in_gripper(
+            obs_cache, _eef_pos_key=f"{pf}eef_pos", _eef_quat_key=f"{pf}eef_quat"
+        ):
+            if _eef_pos_key in obs_cache and _eef_quat_key in obs_cache:
+                return T.pose_inv(
+                    T.pose2mat((obs_cache[_eef_pos_key], obs_cache[_eef_quat_key]))
                 )
-                if f"{pf}eef_pos" in obs_cache and f"{pf}eef_quat" in obs_cache
-                else np.eye(4)
-            )
+            return np.eye(4)
 
         sensors.append(world_pose_in_gripper)
         names.append("world_pose_in_gripper")
@@ -745,91 +957,110 @@ class BDDLBaseDomain(SingleArmEnv):
         """
         pf = self.robots[0].robot_model.naming_prefix
 
+        # Bind constants as default arguments so the per-step calls use local lookups. The
+        # body ids and pose buffers are read from self, since reset_from_xml_string can replace
+        # the sim (refreshing them in _setup_references) without rebuilding these sensors.
         @sensor(modality=modality)
-        def obj_pos(obs_cache):
-            return np.array(self.sim.data.body_xpos[self.obj_body_id[obj_name]])
+        def obj_pos(obs_cache, _env=self, _obj_name=obj_name):
+            # Copy, since observations must not change when the simulation steps
+            return _env._body_xpos[_env.obj_body_id[_obj_name]].copy()
 
         @sensor(modality=modality)
-        def obj_quat(obs_cache):
-            return T.convert_quat(
-                self.sim.data.body_xquat[self.obj_body_id[obj_name]], to="xyzw"
-            )
+        def obj_quat(obs_cache, _env=self, _obj_name=obj_name, _convert_quat=T.convert_quat):
+            return _convert_quat(_env._body_xquat[_env.obj_body_id[_obj_name]], to="xyzw")
+
+        # Observable names, also used as obs_cache keys
+        k_pos = f"{obj_name}_pos"
+        k_quat = f"{obj_name}_quat"
+        k_rel_pos = f"{obj_name}_to_{pf}eef_pos"
+        k_rel_quat = f"{obj_name}_to_{pf}eef_quat"
 
         @sensor(modality=modality)
-        def obj_to_eef_pos(obs_cache):
-            # Immediately return default value if cache is empty
-            if any(
-                [
-                    name not in obs_cache
-                    for name in [
-                        f"{obj_name}_pos",
-                        f"{obj_name}_quat",
-                        "world_pose_in_gripper",
-                    ]
-                ]
-            ):
-                return np.zeros(3)
-            obj_pose = T.pose2mat(
-                (obs_cache[f"{obj_name}_pos"], obs_cache[f"{obj_name}_quat"])
-            )
-            rel_pose = T.pose_in_A_to_pose_in_B(
-                obj_pose, obs_cache["world_pose_in_gripper"]
-            )
-            rel_pos, rel_quat = T.mat2pose(rel_pose)
-            obs_cache[f"{obj_name}_to_{pf}eef_quat"] = rel_quat
+        def obj_to_eef_pos(
+            obs_cache,
+            _k_pos=k_pos,
+            _k_quat=k_quat,
+            _k_rel_quat=k_rel_quat,
+            _k_wpg="world_pose_in_gripper",
+        ):
+            # Computes both relative pos and quat; observables update in registration order,
+            # so obj_to_eef_quat below reads the quat stored here in the same update
+            try:
+                pos = obs_cache[_k_pos]
+                quat = obs_cache[_k_quat]
+                # world_pose_in_gripper already holds the inverted gripper pose
+                world_pose_in_gripper = obs_cache[_k_wpg]
+            except KeyError:
+                # Immediately return default value if cache is empty
+                return _ZERO3
+            rel_pos, rel_quat = _obj_rel_to_eef(pos, quat, world_pose_in_gripper)
+            obs_cache[_k_rel_quat] = rel_quat
             return rel_pos
 
         @sensor(modality=modality)
-        def obj_to_eef_quat(obs_cache):
-            return (
-                obs_cache[f"{obj_name}_to_{pf}eef_quat"]
-                if f"{obj_name}_to_{pf}eef_quat" in obs_cache
-                else np.zeros(4)
-            )
+        def obj_to_eef_quat(obs_cache, _k_rel_quat=k_rel_quat):
+            try:
+                return obs_cache[_k_rel_quat]
+            except KeyError:
+                return _ZERO4
 
         sensors = [obj_pos, obj_quat, obj_to_eef_pos, obj_to_eef_quat]
-        names = [
-            f"{obj_name}_pos",
-            f"{obj_name}_quat",
-            f"{obj_name}_to_{pf}eef_pos",
-            f"{obj_name}_to_{pf}eef_quat",
-        ]
+        names = [k_pos, k_quat, k_rel_pos, k_rel_quat]
 
         return sensors, names
 
     def _add_placement_initializer(self):
 
-        mapping_inv = {}
-        for k, values in self.parsed_problem["fixtures"].items():
-            for v in values:
-                mapping_inv[v] = k
-        for k, values in self.parsed_problem["objects"].items():
-            for v in values:
-                mapping_inv[v] = k
+        mapping_inv = {
+            v: k
+            for k, values in itertools.chain(
+                self.parsed_problem["fixtures"].items(),
+                self.parsed_problem["objects"].items(),
+            )
+            for v in values
+        }
 
         regions = self.parsed_problem["regions"]
         initial_state = self.parsed_problem["initial_state"]
         problem_name = self.parsed_problem["problem_name"]
+        region_targets = {
+            region_name: region["target"] for region_name, region in regions.items()
+        }
+        region_xy_ranges = {
+            region_name: rectangle2xyrange(region["ranges"])
+            for region_name, region in regions.items()
+        }
+
+        # Bucket the initial state by predicate in one pass. Each bucket keeps the bddl
+        # order, so samplers and property initializers are appended in the same order as before.
+        on_states = []
+        in_states = []
+        articulation_states = []
+        for state in initial_state:
+            if state[0] == "on":
+                on_states.append(state)
+            elif state[0] == "in":
+                in_states.append(state)
+            elif state[0] in self._ART_INIT_SAMPLERS:
+                articulation_states.append(state)
 
         conditioned_initial_place_state_on_sites = []
         conditioned_initial_place_state_on_objects = []
-        conditioned_initial_place_state_in_objects = []
+        # (Yifeng) Given that an object needs to have a certain "containing" region in order to hold the relation "In", we assume that users need to specify the containing region of the object already.
+        conditioned_initial_place_state_in_objects = [
+            state for state in in_states if state[2] in regions
+        ]
 
-        for state in initial_state:
-            if state[0] == "on" and state[2] in self.objects_dict:
+        for state in on_states:
+            if state[2] in self.objects_dict:
                 conditioned_initial_place_state_on_objects.append(state)
                 continue
-
-            # (Yifeng) Given that an object needs to have a certain "containing" region in order to hold the relation "In", we assume that users need to specify the containing region of the object already.
-            if state[0] == "in" and state[2] in regions:
-                conditioned_initial_place_state_in_objects.append(state)
-                continue
             # Check if the predicate is in the form of On(object, region)
-            if state[0] == "on" and state[2] in regions:
+            if state[2] in regions:
                 object_name = state[1]
                 region_name = state[2]
-                target_name = regions[region_name]["target"]
-                x_ranges, y_ranges = rectangle2xyrange(regions[region_name]["ranges"])
+                target_name = region_targets[region_name]
+                x_ranges, y_ranges = region_xy_ranges[region_name]
                 yaw_rotation = regions[region_name]["yaw_rotation"]
                 if (
                     target_name in self.objects_dict
@@ -854,76 +1085,50 @@ class BDDLBaseDomain(SingleArmEnv):
                     self.placement_initializer.append_sampler(fixture_sampler)
                 else:
                     # This is to place movable objects.
+                    movable_object = self.objects_dict[object_name]
                     region_sampler = get_region_samplers(
                         problem_name, mapping_inv[target_name]
                     )(
                         object_name,
-                        self.objects_dict[object_name],
+                        movable_object,
                         x_ranges=x_ranges,
                         y_ranges=y_ranges,
-                        rotation=self.objects_dict[object_name].rotation,
-                        rotation_axis=self.objects_dict[object_name].rotation_axis,
+                        rotation=movable_object.rotation,
+                        rotation_axis=movable_object.rotation_axis,
                         reference_pos=self.workspace_offset,
                     )
                     self.placement_initializer.append_sampler(region_sampler)
-            if state[0] in ["open", "close"]:
-                # If "open" is implemented, we assume "close" is also implemented
-                if state[1] in self.object_states_dict and hasattr(
-                    self.object_states_dict[state[1]], "set_joint"
-                ):
-                    obj = self.get_object(state[1])
-                    if state[0] == "open":
-                        joint_ranges = obj.object_properties["articulation"][
-                            "default_open_ranges"
-                        ]
-                    else:
-                        joint_ranges = obj.object_properties["articulation"][
-                            "default_close_ranges"
-                        ]
-
-                    property_initializer = OpenCloseSampler(
-                        name=obj.name,
-                        state_type=state[0],
-                        joint_ranges=joint_ranges,
-                    )
-                    self.object_property_initializers.append(property_initializer)
-            elif state[0] in ["turnon", "turnoff"]:
-                # If "turnon" is implemented, we assume "turnoff" is also implemented.
-                if state[1] in self.object_states_dict and hasattr(
-                    self.object_states_dict[state[1]], "set_joint"
-                ):
-                    obj = self.get_object(state[1])
-                    if state[0] == "turnon":
-                        joint_ranges = obj.object_properties["articulation"][
-                            "default_turnon_ranges"
-                        ]
-                    else:
-                        joint_ranges = obj.object_properties["articulation"][
-                            "default_turnoff_ranges"
-                        ]
-
-                    property_initializer = TurnOnOffSampler(
-                        name=obj.name,
-                        state_type=state[0],
-                        joint_ranges=joint_ranges,
-                    )
-                    self.object_property_initializers.append(property_initializer)
+
+        for state in articulation_states:
+            # If "open" ("turnon") is implemented, we assume "close" ("turnoff") is also implemented
+            if state[1] in self.object_states_dict and hasattr(
+                self.object_states_dict[state[1]], "set_joint"
+            ):
+                obj = self.get_object(state[1])
+                sampler_cls, joint_ranges_key = self._ART_INIT_SAMPLERS[state[0]]
+                property_initializer = sampler_cls(
+                    name=obj.name,
+                    state_type=state[0],
+                    joint_ranges=obj.object_properties["articulation"][joint_ranges_key],
+                )
+                self.object_property_initializers.append(property_initializer)
 
         # Place objects that are on sites
         for state in conditioned_initial_place_state_on_sites:
             object_name = state[1]
+            movable_object = self.objects_dict[object_name]
             region_name = state[2]
-            target_name = regions[region_name]["target"]
+            target_name = region_targets[region_name]
             site_xy_size = self.object_sites_dict[region_name].size[:2]
             sampler = SiteRegionRandomSampler(
                 f"{object_name}_sampler",
-                mujoco_objects=self.objects_dict[object_name],
+                mujoco_objects=movable_object,
                 x_ranges=[[-site_xy_size[0] / 2, site_xy_size[0] / 2]],
                 y_ranges=[[-site_xy_size[1] / 2, site_xy_size[1] / 2]],
                 ensure_object_boundary_in_range=True,
                 ensure_valid_placement=True,
-                rotation=self.objects_dict[object_name].rotation,
-                rotation_axis=self.objects_dict[object_name].rotation_axis,
+                rotation=movable_object.rotation,
+                rotation_axis=movable_object.rotation_axis,
             )
             self.conditional_placement_initializer.append_sampler(
                 sampler, {"reference": target_name, "site_name": region_name}
@@ -931,16 +1136,17 @@ class BDDLBaseDomain(SingleArmEnv):
         # Place objects that are on other objects
         for state in conditioned_initial_place_state_on_objects:
             object_name = state[1]
+            movable_object = self.objects_dict[object_name]
             other_object_name = state[2]
             sampler = ObjectBasedSampler(
                 f"{object_name}_sampler",
-                mujoco_objects=self.objects_dict[object_name],
+                mujoco_objects=movable_object,
                 x_ranges=[[0.0, 0.0]],
                 y_ranges=[[0.0, 0.0]],
                 ensure_object_boundary_in_range=False,
                 ensure_valid_placement=False,
-                rotation=self.objects_dict[object_name].rotation,
-                rotation_axis=self.objects_dict[object_name].rotation_axis,
+                rotation=movable_object.rotation,
+                rotation_axis=movable_object.rotation_axis,
             )
             self.conditional_placement_on_objects_initializer.append_sampler(
                 sampler, {"reference": other_object_name}
@@ -948,19 +1154,20 @@ class BDDLBaseDomain(SingleArmEnv):
         # Place objects inside some containing regions
         for state in conditioned_initial_place_state_in_objects:
             object_name = state[1]
+            movable_object = self.objects_dict[object_name]
             region_name = state[2]
-            target_name = regions[region_name]["target"]
+            target_name = region_targets[region_name]
 
             site_xy_size = self.object_sites_dict[region_name].size[:2]
             sampler = InSiteRegionRandomSampler(
                 f"{object_name}_sampler",
-                mujoco_objects=self.objects_dict[object_name],
+                mujoco_objects=movable_object,
                 # x_ranges=[[-site_xy_size[0] / 2, site_xy_size[0] / 2]],
                 # y_ranges=[[-site_xy_size[1] / 2, site_xy_size[1] / 2]],
                 ensure_object_boundary_in_range=True,
                 ensure_valid_placement=True,
-                rotation=self.objects_dict[object_name].rotation,
-                rotation_axis=self.objects_dict[object_name].rotation_axis,
+                rotation=movable_object.rotation,
+                rotation_axis=movable_object.rotation_axis,
             )
             self.conditional_placement_initializer.append_sampler(
                 sampler, {"reference": target_name, "site_name": region_name}
@@ -973,28 +1180,18 @@ class BDDLBaseDomain(SingleArmEnv):
         super()._reset_internal()
         
         # Reset distance tracking for reward calculation
-        if hasattr(self, 'previous_distance'):
-            delattr(self, 'previous_distance')
+        self.previous_distance = None
 
         # Reset all object positions using initializer sampler if we're not directly loading from an xml
         if not self.deterministic_reset:
 
             # Sample from the placement initializer for all objects
-            for object_property_initializer in self.object_property_initializers:
-                if isinstance(object_property_initializer, OpenCloseSampler):
-                    joint_pos = object_property_initializer.sample()
-                    self.object_states_dict[object_property_initializer.name].set_joint(
-                        joint_pos
-                    )
-                elif isinstance(object_property_initializer, TurnOnOffSampler):
-                    joint_pos = object_property_initializer.sample()
-                    self.object_states_dict[object_property_initializer.name].set_joint(
-                        joint_pos
-                    )
-                else:
-                    print("Warning!!! This sampler doesn't seem to be used")
+            for set_joint, sample in self._joint_setters:
+                set_joint(sample())
             # robosuite didn't provide api for this stepping. we manually do this stepping to increase the speed of resetting simulation.
-            mujoco.mj_step1(self.sim.model._model, self.sim.data._data)
+            # Only needed when joints were just set or site-conditioned samplers read site poses from the sim
+            if self._joint_setters or self.conditional_placement_initializer.samplers:
+                mujoco.mj_step1(self.sim.model._model, self.sim.data._data)
 
             object_placements = self.placement_initializer.sample()
             object_placements = self.conditional_placement_initializer.sample(
@@ -1005,13 +1202,14 @@ class BDDLBaseDomain(SingleArmEnv):
                     object_placements
                 )
             )
+            fixture_names = self.fixtures_dict.keys()
+            qpos = self.sim.data.qpos
             for obj_pos, obj_quat, obj in object_placements.values():
-                if obj.name not in list(self.fixtures_dict.keys()):
-                    # This is for movable object resetting
-                    self.sim.data.set_joint_qpos(
-                        obj.joints[-1],
-                        np.concatenate([np.array(obj_pos), np.array(obj_quat)]),
-                    )
+                if obj.name not in fixture_names:
+                    # This is for movable object resetting: write the free joint's pos + quat in place
+                    qpos_addr = self._joint_qpos_addr[obj.name]
+                    qpos[qpos_addr : qpos_addr + 3] = obj_pos
+                    qpos[qpos_addr + 3 : qpos_addr + 7] = obj_quat
                 else:
                     # This is for fixture resetting
                     body_id = self.sim.model.body_name2id(obj.root_body)
@@ -1027,32 +1225,27 @@ class BDDLBaseDomain(SingleArmEnv):
         """
         return False
 
-    def visualize(self, vis_settings):
-        """
-        In addition to super call, visualize gripper site proportional to the distance to the drawer handle.
-
-        Args:
-            vis_settings (dict): Visualization keywords mapped to T/F, determining whether that specific
-                component should be visualized. Should have "grippers" keyword as well as any other relevant
-                options specified.
-        """
-        # Run superclass method first
-        super().visualize(vis_settings=vis_settings)
-
     def step(self, action):
         if self.action_dim == 4 and len(action) > 4:
             # Convert OSC_POSITION action
-            action = np.array(action)
-            action = np.concatenate((action[:3], action[-1:]), axis=-1)
-
-        obs, reward, done, info = super().step(action)
-        done = self._check_success()
+            # (the controllers only read the action within this step, so the buffer is reused)
+            action = np.asarray(action)
+            action4 = self._action4
+            action4[:3] = action[:3]
+            action4[3] = action[-1]
+            action = action4
+
+        # The simulation state is fixed once physics has stepped, so the goal predicates
+        # evaluated for the reward can be reused for the done check
+        self._predicate_sat_cache = {}
+        try:
+            obs, reward, done, info = super().step(action)
+            done = self._check_success()
+        finally:
+            self._predicate_sat_cache = None
 
         return obs, reward, done, info
 
-    def _pre_action(self, action, policy_step=False):
-        super()._pre_action(action, policy_step=policy_step)
-
     def _post_action(self, action):
         reward, done, info = super()._post_action(action)
 
@@ -1062,8 +1255,8 @@ class BDDLBaseDomain(SingleArmEnv):
 
     def _post_process(self):
         # Update some object states, such as light switching etc.
-        for object_state in self.tracking_object_states_change:
-            object_state.update_state()
+        for update_state in self._update_state_fns:
+            update_state()
 
     def get_robot_state_vector(self, obs):
         return np.concatenate(
@@ -1077,7 +1270,7 @@ class BDDLBaseDomain(SingleArmEnv):
         Args:
             object_name (str): The name string of the object in query
         """
-        return object_name in list(self.fixtures_dict.keys())
+        return object_name in self.fixtures_dict
 
     @property
     def language_instruction(self):
@@ -138,14 +138,7 @@ class Libero_Study_Tabletop_Manipulation(BDDLBaseDomain):
         """
         Check if the goal is achieved. Consider conjunction goals at the moment
         """
-        goal_state = self.parsed_problem["goal_state"]
-        result = True
-        for state in goal_state:
-            result = self._eval_predicate(state) and result
-        #     if not result:
-        #         return False
-        # return True
-        return result
+        return bool(self._batch_predicate_sat(self._goal_state).all())
 
     def _eval_predicate(self, state):
         if len(state) == 3:
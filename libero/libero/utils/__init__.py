@@ -29,6 +29,10 @@ def get_path_dict(root_location=os.path.dirname(os.path.abspath(__file__))):
 
 
 def get_libero_path(key):
+    # The config file is created lazily by libero.libero on first use
+    from libero.libero import _ensure_config
+
+    _ensure_config()
     with open(config_file, "r") as f:
         config = dict(yaml.load(f.read(), Loader=yaml.FullLoader))
     assert key in config, f"Key {key} not found in config file {config_file}"
@@ -37,16 +41,6 @@ def get_libero_path(key):
 
 def set_libero_path(custom_location=os.path.dirname(os.path.abspath(__file__))):
     new_config = get_path_dict(custom_location)
+    os.makedirs(libero_config_path, exist_ok=True)
     with open(config_file, "w") as f:
         yaml.dump(new_config, f)
-
-
-if not os.path.exists(libero_config_path):
-    os.makedirs(libero_config_path)
-
-if not os.path.exists(config_file):
-    # Create a default config file
-
-    # write all the paths into a yaml file
-    with open(config_file, "w") as f:
-        yaml.dump(get_path_dict(), f)
@@ -141,14 +141,10 @@ class YOUR_CLASS_NAME(BDDLBaseDomain):
         """
         Check if the goal is achieved. Consider conjunction goals at the moment
         """
-        goal_state = self.parsed_problem["goal_state"]
-        result = True
-        for state in goal_state:
-            result = self._eval_predicate(state) and result
-        return result
+        return bool(self._batch_predicate_sat(self._goal_state).all())
 
     def _eval_predicate(self, state):
-        """Evaluate each predicate. For the moment, we only consider unary and binary predicates."""
+        """Evaluate each predicate. For the moment, we only consider unary and binary predicates. Both _check_success and reward shaping go through this method, so modify it to customize predicate checking."""
         if len(state) == 3:
             # Checking binary logical predicates
             predicate_fn_name = state[0]